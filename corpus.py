@@ -11,6 +11,8 @@ import statistics
 import math
 import re
 from operator import itemgetter
+from gazetteer import Gazetteer
+from length_index import LengthIndex
 
 
 class Corpus:
@@ -23,6 +25,9 @@ class Corpus:
     pos_tag = None  # pos-tagged version of the corpus
     n_token = None  # number of tokens
     n_sentences = None  # number of sentences
+    sentences_token = None  # tokenized copy of every sentence of the corpus
+    length_index = None  # index of the lengths (in tokens and in characters) of the sentences of the corpus
+    gazetteer = None  # gazetteer with the lists of terms (months, days of the week, ...) to find in the corpus
 
     # CONSTRUCTOR
     # Args:
@@ -68,6 +73,33 @@ class Corpus:
     def _set_sentences(self):
         self.sentences = sent_tokenize(self.get_raw())
 
+    def get_sentences_token(self):
+        if self.sentences_token is None:
+            self._set_sentences_token()
+        return self.sentences_token
+
+    def _set_sentences_token(self):
+        self.sentences_token = [word_tokenize(sentence) for sentence in self.get_sentences()]
+
+    def get_length_index(self):
+        if self.length_index is None:
+            self._set_length_index()
+        return self.length_index
+
+    def _set_length_index(self):
+        # the lengths are calculated only when needed, so that the queries in characters never tokenize the corpus
+        self.length_index = LengthIndex(lambda: [len(tokens) for tokens in self.get_sentences_token()],
+                                        lambda: [len(sentence) for sentence in self.get_sentences()])
+
+    # Returns the length index with the posting list of the sentences that contain content
+    # PARAM:
+    #   content: the word that the sentences must contain, when content = None the index is returned as it is
+    def _length_index_posting(self, content=None):
+        length_index = self.get_length_index()
+        if content is not None and not length_index.has_posting(content):
+            length_index.add_posting(content, self.find_words_index(content))
+        return length_index
+
     def get_pos_tag_universal(self):
         if self.pos_tag_universal is None:
             self._set_pos_tag_universal()
@@ -84,6 +116,14 @@ class Corpus:
     def _set_pos_tag(self):
         self.pos_tag = pos_tag(self.get_token())
 
+    def get_gazetteer(self):
+        if self.gazetteer is None:
+            self._set_gazetteer()
+        return self.gazetteer
+
+    def _set_gazetteer(self):
+        self.gazetteer = Gazetteer(default=True)
+
     def get_n_sentences(self):
         return len(self.get_sentences())
 
@@ -98,10 +138,7 @@ class Corpus:
 
     # Returns the arithmetic mean of number of tokens in the sentences of the corpus.
     def mean_sentences(self):
-        temp = []
-        for sentence in self.get_sentences():
-            temp.append(len(word_tokenize(sentence)))
-        return statistics.mean(temp)
+        return statistics.mean(self.get_length_index().get_lengths("token"))
 
     # Returns the arithmetic mean of number of letters in the tokens of the corpus.
     def mean_token(self):
@@ -286,10 +323,17 @@ class Corpus:
     # PARAM:
     #   word: word to be found
     def find_words(self, word):
+        sentences = self.get_sentences()
+        return [sentences[i] for i in self.find_words_index(word)]
+
+    # Returns the list of the indices of the sentences containing the parameter word
+    # PARAM:
+    #   word: word to be found
+    def find_words_index(self, word):
         output = []
-        for sentence in self.get_sentences():
+        for i, sentence in enumerate(self.get_sentences()):
             if str(word[:len(word) - 1]) in str(sentence):  # word[:len(word)-1] because NLTK returns name+space
-                output.append(sentence)
+                output.append(i)
         return output
 
     # Returns an ordinated (decreasing by their frequencies) lists of token of the specified grammar category and their frequencies
@@ -387,49 +431,42 @@ class Corpus:
             output[date] += 1
         return list(sorted(output.items(), key=itemgetter(1), reverse=True))
 
+    # Returns a dictionary (keys: name of the list, value: dictionary (keys: index of the sentence, value: dictionary
+    # (keys: term, value: frequency))) of the terms of every list of the gazetteer found in the corpus, the sentences
+    # are scanned only once for all the lists
+    # (the index of the sentence always refers to the list returned by get_sentences())
+    # PARAM:
+    #   content: the word that the sentences must contain, when content = None the method analyze the sentences of the
+    #            all corpus
+    def find_gazetteer(self, content=None):
+        if content is None:
+            return self.get_gazetteer().find(self.get_sentences())
+        indices = self.find_words_index(content)
+        sentences = self.get_sentences()
+        return self.get_gazetteer().find([sentences[i] for i in indices], indices)
+
+    # Returns an ordinated (decreasing by their frequencies) lists of terms of a list of the gazetteer and their
+    # frequencies
+    # PARAM:
+    #   name: name of the list of the gazetteer (e.g. "month", "day_week" or a list added with add_list())
+    #   content: the word that should be in the same sentence as the terms, when content = None the method return
+    #           terms of the all corpus
+    def find_gazetteer_list(self, name, content=None):
+        return Gazetteer.frequencies(self.find_gazetteer(content), name)
+
     # Returns an ordinated (decreasing by their frequencies) lists of month as strings and their frequencies
     # PARAM:
     #   content: the word that should be in the same sentence as the month, when content = None the method return
     #           month of the all corpus
     def find_month_regex(self, content=None):
-        output = dict()
-        if content is None:
-            string_to_analyze = self.get_raw()
-        else:
-            string_to_analyze = ' '.join([str(elem) for elem in self.find_words(content)])
-        month_list = re.findall(
-            r"([Jj]anuary|[Ff]ebruary|[Mm]arch|[Aa]pril|[Mm]ay|[Jj]une|[Jj]uly|[Aa]ugust|[Ss]eptember|[Oo]ctober|[Nn]ovember|[Dd]ecember)",
-            string_to_analyze)  # parsing with regular expressions looking for complete months names
-        month_list.extend(re.findall(
-            r"([Jj]an|[Ff]feb|[Mm]ar|[Aa]pr|[Jj]un|[Jj]ul|[Aa]ug|[Ss]ep(t)?|[Oo]ct|[Nn]ov|[Dd]ec)\.",
-            string_to_analyze))  # parsing with regular expressions looking for abbreviated months names
-        for month in month_list:
-            if month not in output:
-                output[month] = 0
-            output[month] += 1
-        return list(sorted(output.items(), key=itemgetter(1), reverse=True))
+        return self.find_gazetteer_list("month", content)
 
     # Returns an ordinated (decreasing by their frequencies) lists of day of the week as strings and their frequencies
     # PARAM:
     #   content: the word that should be in the same sentence as the day of the week, when content = None
     #           the method return day of the week of the all corpus
     def find_day_week_regex(self, content=None):
-        output = dict()
-        if content is None:
-            string_to_analyze = self.get_raw()
-        else:
-            string_to_analyze = ' '.join([str(elem) for elem in self.find_words(content)])
-        month_list = re.findall(
-            r"([Mm]onday|[Tt]uesday|[Ww]ednesday|[Ff]riday|[Ss]aturday|[Ss]unday)",
-            string_to_analyze)  # parsing with regular expressions looking for complete months names
-        month_list.extend(re.findall(
-            r"([Mm]on|[Tt]ue|[Ww]ed|[Ff]ri|[Ss]at|[Ss]un)\.",
-            string_to_analyze))  # parsing with regular expressions looking for abbreviated months names
-        for month in month_list:
-            if month not in output:
-                output[month] = 0
-            output[month] += 1
-        return list(sorted(output.items(), key=itemgetter(1), reverse=True))
+        return self.find_gazetteer_list("day_week", content)
 
     # Returns a dictionary (keys: name, value: list of sentence) of sentences containing the persons name in the Corpus
     # PARAM:
@@ -452,12 +489,34 @@ class Corpus:
     # PARAM:
     #   content: the word that the longest and shortest sentences must contain, when content = None the method return the
     #            longest and shortest sentences of the all corpus
-    def min_max_sentence(self, content=None):
-        if content is None:
-            sentences = self.get_sentences()
-        else:
-            sentences = self.find_words(content)
-        return min(sentences, key=len), max(sentences, key=len)
+    #   measure: "char" to measure the length of the sentences in characters, "token" to measure it in tokens
+    def min_max_sentence(self, content=None, measure="char"):
+        min_max = self._length_index_posting(content).min_max(content, measure)
+        if min_max is None:
+            raise ValueError("There are no sentences that contain " + str(content))
+        return self.get_sentences()[min_max[0]], self.get_sentences()[min_max[1]]
+
+    # Returns a list of sentences whose length is between min_length and max_length (included), ordered by length
+    # PARAM:
+    #   min_length: the minimum length of the sentences, when None there is no minimum length
+    #   max_length: the maximum length of the sentences, when None there is no maximum length
+    #   content: the word that the sentences must contain, when content = None the method return the sentences of the
+    #            all corpus
+    #   measure: "token" to measure the length of the sentences in tokens, "char" to measure it in characters
+    def sentences_length(self, min_length=None, max_length=None, content=None, measure="token"):
+        sentences = self.get_sentences()
+        return [sentences[i] for i in
+                self._length_index_posting(content).window(min_length, max_length, content, measure)]
+
+    # Returns a dictionary (keys: lower bound of the length bin, value: number of sentences) of the lengths of the
+    # sentences of the corpus
+    # PARAM:
+    #   content: the word that the sentences must contain, when content = None the method use the sentences of the
+    #            all corpus
+    #   measure: "token" to measure the length of the sentences in tokens, "char" to measure it in characters
+    #   width: width of the length bins, when width is None the default value is 1
+    def length_histogram(self, content=None, measure="token", width=None):
+        return self._length_index_posting(content).histogram(content, measure, width)
 
     # Returns an ordinated (more probable to less probable) list containing sentences and their markov's (order 0) probability
     # PARAM:
@@ -469,15 +528,12 @@ class Corpus:
     def probability_markov0(self, content=None, min_length=None, max_length=None):
         freq = nltk.FreqDist(self.get_token())  # frequency of every token in the corpus
         output = dict()
-        if content is None:
-            sentences = self.get_sentences()
-        else:
-            sentences = self.find_words(content)
-        for sentence in sentences:
+        sentences = self.get_sentences()
+        sentences_token = self.get_sentences_token()
+        # only the sentences in the length window are analyzed, in the order of the corpus
+        for i in sorted(self._length_index_posting(content).window(min_length, max_length, content, "token")):
             prob = 1.0  # initial probability
-            tokens = word_tokenize(sentence)
-            if (min_length <= len(tokens) <= max_length) or (min_length is None and max_length is None) or (min_length is None and len(tokens) <= max_length) or (min_length <= len(tokens) and max_length is None):
-                for token in tokens:
-                    prob *= (freq[token] * 1.0 / self.get_n_token() * 1.0)
-                output[sentence] = prob
+            for token in sentences_token[i]:
+                prob *= (freq[token] * 1.0 / self.get_n_token() * 1.0)
+            output[sentences[i]] = prob
         return list(sorted(output.items(), key=itemgetter(1), reverse=True))
@@ -0,0 +1,135 @@
+import re
+from operator import itemgetter
+
+# Built-in term lists: complete names and abbreviated names (the abbreviated names are matched only when
+# they are followed by a dot, e.g. "jan.")
+MONTHS = ["january", "february", "march", "april", "may", "june", "july", "august", "september", "october",
+          "november", "december"]
+ABB_MONTHS = ["jan", "feb", "mar", "apr", "jun", "jul", "aug", "sep", "sept", "oct", "nov", "dec"]
+DAYS_WEEK = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+ABB_DAYS_WEEK = ["mon", "tue", "tues", "wed", "thu", "thur", "thurs", "fri", "sat", "sun"]
+
+
+class Gazetteer:
+    lists = None  # keys -> name of the list | value -> dict (keys -> term to match | value -> term to report)
+    regex = None  # compiled matcher of every term of every list, None when it must be (re)compiled
+    lookup = None  # keys -> matched term | value -> list of (name of the list, term to report)
+
+    # CONSTRUCTOR
+    # Args:
+    #   default: boolean, when True the gazetteer is created with the built-in lists "month" and "day_week",
+    #            when False the gazetteer is created empty
+    def __init__(self, default=False):
+        self.lists = dict()
+        if default:
+            self.add_list("month", MONTHS, ABB_MONTHS)
+            self.add_list("day_week", DAYS_WEEK, ABB_DAYS_WEEK)
+
+    # Adds (or extends) a named list of terms, the matcher is recompiled at the next search
+    # Args:
+    #   name: name of the list, used as key in the output of find()
+    #   terms: complete forms of the terms (a term can contain more than one word, e.g. "new year's day")
+    #   abbreviations: abbreviated forms of the terms, matched only when followed by a dot,
+    #                  when abbreviations is None the list has only complete forms
+    # Terms and abbreviations are lowercased (as the text of the corpus) and must not be empty, otherwise raise
+    # ValueError
+    def add_list(self, name, terms, abbreviations=None):
+        if abbreviations is None:
+            abbreviations = []
+        terms = [term.lower() for term in terms]
+        abbreviations = [term.lower() for term in abbreviations]
+        if "" in terms or "" in abbreviations:
+            raise ValueError("Terms of the list " + str(name) + " can't be empty")
+        if name not in self.lists:
+            self.lists[name] = dict()
+        for term in terms:
+            self.lists[name][term] = term
+        for term in abbreviations:
+            self.lists[name][term + "."] = term
+        self.regex = None
+
+    def get_names(self):
+        return list(self.lists.keys())
+
+    def get_regex(self):
+        if self.regex is None:
+            self._set_regex()
+        return self.regex
+
+    # Compiles every term of every list in a single regular expression shaped as a trie, so that terms sharing a
+    # prefix (e.g. "mar.", "march") are tested together and the text is scanned only once for all the lists
+    def _set_regex(self):
+        trie = dict()
+        self.lookup = dict()
+        for name, terms in self.lists.items():
+            for term, label in terms.items():
+                node = trie
+                for char in term:
+                    node = node.setdefault(char, dict())
+                node[""] = True  # end of a term
+                self.lookup.setdefault(term, list()).append((name, label))
+        if not trie:
+            self.regex = None
+            return
+        # (?<!\w) and (?!\w) avoid matching terms inside other words (e.g. "mon" in "money"), abbreviations
+        # already end with a dot so they can be followed by anything (e.g. "sept.2020"), the matching is case sensitive
+        # because terms (and the text of the corpus) are lowercased
+        self.regex = re.compile(r"(?<!\w)(?:" + _trie_to_regex(trie) + r")(?:(?<=\.)|(?!\w))")
+
+    # Returns a dictionary (keys: name of the list, value: dictionary (keys: index of the sentence, value: dictionary
+    # (keys: term, value: frequency of the term in the sentence))), sentences without hits are not in the output
+    # Args:
+    #   sentences: list of lowercased sentences to analyze
+    #   indices: list of the indices to use in the output for the sentences (e.g. their position in the corpus),
+    #            when indices is None the position of the sentence in the list sentences is used
+    def find(self, sentences, indices=None):
+        if indices is None:
+            indices = range(len(sentences))
+        output = dict()
+        for name in self.lists:
+            output[name] = dict()
+        regex = self.get_regex()
+        if regex is None:
+            return output
+        for index, sentence in zip(indices, sentences):
+            for match in regex.finditer(sentence):
+                for name, label in self.lookup[match.group()]:
+                    hits = output[name].setdefault(index, dict())
+                    if label not in hits:
+                        hits[label] = 0
+                    hits[label] += 1
+        return output
+
+    # Returns an ordinated (decreasing by their frequencies) lists of terms of a list and their frequencies
+    # Args:
+    #   hits: the output of find()
+    #   name: name of the list whose frequencies are calculated
+    @staticmethod
+    def frequencies(hits, name):
+        output = dict()
+        for sentence_hits in hits[name].values():
+            for term, freq in sentence_hits.items():
+                if term not in output:
+                    output[term] = 0
+                output[term] += freq
+        return list(sorted(output.items(), key=itemgetter(1), reverse=True))
+
+
+# Returns the regular expression that matches every term of the trie
+# Args:
+#   node: node of the trie (keys -> next character, "" -> end of a term)
+def _trie_to_regex(node):
+    branches = list()
+    for char in sorted(node):
+        if char != "":
+            branches.append(re.escape(char) + _trie_to_regex(node[char]))
+    optional = "" in node  # the terms can end in this node
+    if not branches:
+        return ""
+    if len(branches) == 1 and not optional:
+        return branches[0]
+    # longer terms are tried first and the shorter one is the fallback
+    pattern = "(?:" + "|".join(branches) + ")"
+    if optional:
+        pattern += "?"
+    return pattern
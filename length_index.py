@@ -0,0 +1,115 @@
+from bisect import bisect_left, bisect_right
+
+MEASURES = ("token", "char")  # possible measures of the length of a sentence
+
+
+class LengthIndex:
+    length_functions = None  # keys -> measure | value -> function that returns the lengths of the sentences
+    lengths = None  # keys -> measure | value -> list of the lengths of the sentences (in the order of the corpus)
+    contents = None  # keys -> content (None for the all corpus) | value -> indices of the sentences with content
+    postings = None  # keys -> content (None for the all corpus) | value -> dict (keys -> measure | value -> posting)
+
+    # CONSTRUCTOR
+    # Args:
+    #   token_lengths: function without arguments that returns the list of the lengths (in tokens) of the sentences of
+    #                  the corpus, called only the first time that the lengths in tokens are needed
+    #   char_lengths: function without arguments that returns the list of the lengths (in characters) of the sentences
+    #                 of the corpus, called only the first time that the lengths in characters are needed
+    def __init__(self, token_lengths, char_lengths):
+        self.length_functions = {"token": token_lengths, "char": char_lengths}
+        self.lengths = dict()
+        self.contents = {None: None}
+        self.postings = {None: dict()}
+
+    def get_lengths(self, measure):
+        if _check_measure(measure) not in self.lengths:
+            self._set_lengths(measure)
+        return self.lengths[measure]
+
+    def _set_lengths(self, measure):
+        self.lengths[measure] = list(self.length_functions[measure]())
+
+    # Adds the sentences that contain content, their posting lists are built at the first query
+    # Args:
+    #   content: the word that the sentences contain
+    #   indices: ascending list of the indices of the sentences that contain content
+    def add_posting(self, content, indices):
+        self.contents[content] = list(indices)
+        self.postings[content] = dict()
+
+    def has_posting(self, content):
+        return content in self.postings
+
+    # Returns the posting list of the sentences that contain content: the indices of the sentences sorted by length
+    # (the sentences with the same length keep the order of the corpus) together with their lengths, so that every
+    # query is answered with binary search
+    # Args:
+    #   content: the word that the sentences contain, when content = None the posting list of the all corpus
+    #   measure: "token" or "char", the unit of the length of the sentences
+    def get_posting(self, content=None, measure="char"):
+        if _check_measure(measure) not in self.postings[content]:
+            self._set_posting(content, measure)
+        return self.postings[content][measure]
+
+    def _set_posting(self, content, measure):
+        lengths = self.get_lengths(measure)
+        indices = self.contents[content]
+        if indices is None:
+            indices = range(len(lengths))
+        order = sorted(indices, key=lambda i: lengths[i])  # sorted() is stable
+        self.postings[content][measure] = ([lengths[i] for i in order], order)
+
+    # Returns a tuple containing as first element the index of the shortest sentence and as second element the index
+    # of the longest sentence (the first one in the corpus when more sentences have the same length), None when there
+    # are no sentences
+    # Args:
+    #   content: the word that the sentences must contain, when content = None the method use the all corpus
+    #   measure: "token" or "char", the unit of the length of the sentences
+    def min_max(self, content=None, measure="char"):
+        keys, order = self.get_posting(content, measure)
+        if not keys:
+            return None
+        return order[0], order[bisect_left(keys, keys[-1])]
+
+    # Returns the list of the indices of the sentences whose length is between min_length and max_length (included),
+    # ordered by length
+    # Args:
+    #   min_length: the minimum length of the sentences, when None there is no minimum length
+    #   max_length: the maximum length of the sentences, when None there is no maximum length
+    #   content: the word that the sentences must contain, when content = None the method use the all corpus
+    #   measure: "token" or "char", the unit of the length of the sentences
+    def window(self, min_length=None, max_length=None, content=None, measure="token"):
+        keys, order = self.get_posting(content, measure)
+        start = 0 if min_length is None else bisect_left(keys, min_length)
+        end = len(keys) if max_length is None else bisect_right(keys, max_length, start)
+        return order[start:end]
+
+    # Returns a dictionary (keys: lower bound of the length bin, value: number of sentences in the bin)
+    # Args:
+    #   content: the word that the sentences must contain, when content = None the method use the all corpus
+    #   measure: "token" or "char", the unit of the length of the sentences
+    #   width: width of the length bins (greater than 0, otherwise raise ValueError), when width is None the default
+    #          value is 1
+    def histogram(self, content=None, measure="token", width=None):
+        if width is None:
+            width = 1
+        if width <= 0:
+            raise ValueError("Width must be greater than 0")
+        keys, order = self.get_posting(content, measure)
+        output = dict()
+        position = 0
+        while position < len(keys):  # jumping from a bin to the next one
+            lower_bound = keys[position] // width * width
+            next_position = bisect_left(keys, lower_bound + width, position)
+            output[lower_bound] = next_position - position
+            position = next_position
+        return output
+
+
+# Returns the measure if it is valid, otherwise raise ValueError
+# Args:
+#   measure: measure to check
+def _check_measure(measure):
+    if measure not in MEASURES:
+        raise ValueError("Measure must be one of " + ", ".join(MEASURES))
+    return measure
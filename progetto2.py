@@ -19,10 +19,11 @@ def exec(file_name1, file_name2):
         # All the sentences that contains the 10 most frequent person's name
         utils.print_array_file(output, "Sentences that contain " + key + " in " + corpus1.get_name(), value, True)
         # Shortest and longest sentence that contains the key (name)
+        shortest, longest = corpus1.min_max_sentence(key)
         utils.print_var_file(output, "Shortest sentence that contain " + key + " in " + corpus1.get_name(),
-                             corpus1.min_max_sentence(key)[0], True)
+                             shortest, True)
         utils.print_var_file(output, "Longest sentence that contain " + key + " in " + corpus1.get_name(),
-                             corpus1.min_max_sentence(key)[1], True)
+                             longest, True)
         # Places contained in sentences that also contain key (name)
         utils.print_array_file(output,
                                "Places contained in sentences that also contain " + key + " in " + corpus1.get_name(),
@@ -65,10 +66,11 @@ def exec(file_name1, file_name2):
         # All the sentences that contains the 10 most frequent person's name
         utils.print_array_file(output, "Sentences that contain " + key + " in " + corpus2.get_name(), value, True)
         # Shortest and longest sentence that contains the key (name)
+        shortest, longest = corpus2.min_max_sentence(key)
         utils.print_var_file(output, "Shortest sentence that contain " + key + " in " + corpus2.get_name(),
-                             corpus2.min_max_sentence(key)[0], True)
+                             shortest, True)
         utils.print_var_file(output, "Longest sentence that contain " + key + " in " + corpus2.get_name(),
-                             corpus2.min_max_sentence(key)[1], True)
+                             longest, True)
         # Places contained in sentences that also contain key (name)
         utils.print_array_file(output,
                                "Places contained in sentences that also contain " + key + " in " + corpus2.get_name(),